@@ -1,12 +1,25 @@
-import os
-
 import pytest
 
-from database import DB
+from database import DB, Habit, Periodicity
 
 
 @pytest.fixture(scope='function', autouse=True)
 def db_connection():
-    db_to_delete = DB('test_daily_habit.db')
-    yield db_to_delete
-    os.remove('test_daily_habit.db')
+    # An in-memory database keeps each test isolated without paying for file
+    # creation and removal; closing the connection disposes of it.
+    db = DB(':memory:')
+    yield db
+    db.connection.close()
+
+
+@pytest.fixture
+def overdue_habit(db_connection):
+    # The daily habit with three tasks that both the overdue-task and the
+    # report-generation tests build; constructed once here, without tasks,
+    # so tests control when the task batch appears.
+    return Habit(
+        'Habit 1 overdue',
+        Periodicity.DAILY,
+        ['Task 1 Overdue', 'Task 2 Overdue', 'Task 3 Overdue'],
+        db=db_connection,
+    ).save()
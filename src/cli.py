@@ -1,19 +1,43 @@
 """
     Command-Line Interface (CLI) function.
 
-    This function is the entry point for a command-line interface application.
-
-    However, as it stands, the function has no implementation inside the function body, and thus,
-    it does not perform any actions or execute any commands when called. Developers typically
-    extend the functionality of this function to handle command-line arguments,
-    execute various tasks, and interact with users through the terminal.
-    Note: Without any implementation, this function does not produce any output or
-    perform any actions when executed.
+    This module is the entry point for a command-line interface application.
+
+    The command group loads its command modules lazily: each module under
+    `commands` registers itself via `@cli.command()` as a side effect of its
+    import, so importing all of them eagerly paid for every command's
+    dependencies (tabulate, database setup, ...) on every start-up, including
+    plain `--help` calls. `LazyGroup` defers each import until the command is
+    actually looked up.
 """
+import importlib
+
 import click
 
+# Maps each registered command name to the module whose import registers it.
+COMMAND_MODULES = {
+    'analyse-data': 'commands.analyse_data',
+    'complete-task': 'commands.complete_task',
+    'create-habit': 'commands.create_habit',
+    'delete-habit': 'commands.delete_habit',
+    'list-habits': 'commands.list_habits',
+    'sync-tasks': 'commands.sync_tasks',
+}
+
+
+class LazyGroup(click.Group):
+    """ A click Group that imports a command's module on first lookup."""
+
+    def list_commands(self, ctx):
+        return sorted(set(self.commands) | set(COMMAND_MODULES))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in COMMAND_MODULES:
+            importlib.import_module(COMMAND_MODULES[cmd_name])
+        return super().get_command(ctx, cmd_name)
+
 
-@click.group()
+@click.group(cls=LazyGroup)
 # @click.option('--version')
 def cli():
     """
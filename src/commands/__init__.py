@@ -1,6 +1,6 @@
-from .analyse_data import analyse_data
-from .complete_task import complete_task
-from .create_habit import create_habit
-from .delete_habit import delete_habit
-from .list_habits import list_habits
-from .sync_tasks import sync_tasks
+"""
+The command modules register themselves on the CLI group when imported.
+`cli.LazyGroup` imports each one on demand, so this package intentionally
+re-exports nothing: an eager import here would pull in every command's
+dependencies on start-up again.
+"""
@@ -0,0 +1,48 @@
+"""
+Shared constants for the command modules. The Periodicity enum is fixed at import
+time, so the prompt options and the Click choice built from it are computed once
+here instead of on every command invocation.
+"""
+
+import click
+
+from database import Periodicity
+
+from ._fastfmt import format_table
+
+PERIODICITY_NAMES = tuple(v.name for v in Periodicity)
+
+
+class PeriodicityType(click.Choice):
+    """ A Click choice over the Periodicity names whose converted value is the
+    enum member itself, so callers do not have to re-run the name lookup."""
+
+    def __init__(self):
+        super().__init__(PERIODICITY_NAMES, case_sensitive=False)
+
+    def convert(self, value, param, ctx) -> Periodicity:
+        return Periodicity[super().convert(value, param, ctx)]
+
+
+PERIODICITY_CHOICE = PeriodicityType()
+
+# Shared tabulate headers, built once instead of as a fresh list per call.
+HABIT_HEADERS = ("ID", "Name", "Periodicity", "Streak", "Tasks", "Completed")
+HABIT_LIST_HEADERS = ("Habit ID", "Habit Name")
+STREAK_HEADERS = ("Habit Name", "Streak")
+
+
+def habit_table(rows) -> str:
+    """ Renders habit overview rows with the shared headers.
+
+    One helper for the identical render in list-habits, delete-habit and
+    the analyse-data streak overview, so all three share the same headers
+    and renderer instead of repeating the call with ad-hoc arguments.
+
+    Args:
+        rows (iterable): Habit overview rows as produced by
+            DB.habit_overview_rows / iter_habit_overview_rows.
+
+    Returns:
+        str: The rendered table, ready to print."""
+    return format_table(rows, HABIT_HEADERS)
@@ -0,0 +1,53 @@
+"""
+A minimal table renderer for the report views. It draws the same box layout as
+tabulate's "fancy_outline" style, but computes column widths in a single pass
+and joins plain f-string cells, skipping tabulate's per-cell wrapping and
+style-registry machinery on result sets that can grow large.
+
+Set the environment variable HABIT_TABLE_RENDERER=tabulate to fall back to
+tabulate's renderer.
+"""
+
+import os
+
+from tabulate import tabulate
+
+USE_TABULATE = os.environ.get('HABIT_TABLE_RENDERER') == 'tabulate'
+
+
+def format_table(rows, headers) -> str:
+    """ Renders rows and headers as a boxed text table.
+
+    Args:
+        * rows (iterable): The table rows; cells are converted with str().
+        * headers (iterable): The column headers.
+    Returns: str: The rendered table, ready to print."""
+
+    if USE_TABULATE:
+        # The cells are printed verbatim either way, so skip tabulate's
+        # per-cell numeric detection.
+        return tabulate(rows, tablefmt="fancy_outline", headers=headers,
+                        disable_numparse=True)
+
+    headers = [str(header) for header in headers]
+    rows = [['' if cell is None else str(cell) for cell in row] for row in rows]
+    widths = [len(header) for header in headers]
+    for row in rows:
+        for index, cell in enumerate(row):
+            if len(cell) > widths[index]:
+                widths[index] = len(cell)
+
+    def border(left, sep, right):
+        return left + sep.join('═' * (width + 2) for width in widths) + right
+
+    def line(cells):
+        return '│ ' + ' │ '.join(
+            cell.ljust(width) for cell, width in zip(cells, widths)) + ' │'
+
+    return '\n'.join([
+        border('╒', '╤', '╕'),
+        line(headers),
+        border('╞', '╪', '╡'),
+        *[line(row) for row in rows],
+        border('╘', '╧', '╛'),
+    ])
@@ -3,12 +3,85 @@ This command executes all the predefined reports users can access.
 """
 
 import click
-from tabulate import tabulate
 
 from cli import cli
-from database import DB, Periodicity, as_array, Habit
+from database import get_db, as_array
 
-db = DB()
+from ._common import (
+    HABIT_LIST_HEADERS,
+    PERIODICITY_CHOICE,
+    STREAK_HEADERS,
+    habit_table,
+)
+from ._fastfmt import format_table
+
+PERIOD_HEADERS = ("Periodicity", "Habit Name")
+
+
+def _report_streak_overview():
+    """ Prints the current streak overview for all habits."""
+    db = get_db()
+    print(habit_table(db.habit_overview_rows(row_factory=as_array)))
+
+
+def _report_same_period():
+    """ Prints all habits sharing a prompted periodicity."""
+    db = get_db()
+    periodicity = click.prompt(
+        'Please enter the habit Periodicity',
+        type=PERIODICITY_CHOICE
+    )
+    table = db.report_same_period(periodicity.name, row_factory=as_array)
+    print(format_table(table, PERIOD_HEADERS))
+
+
+def _report_longest_streak_given_habit():
+    """ Prints the longest run streak for a prompted habit."""
+    db = get_db()
+    table = db.get_habit_list_snapshot(row_factory=as_array)
+    print(format_table(table, HABIT_LIST_HEADERS))
+
+    id_habit = click.prompt(
+        'Please provide the Habit ID for which you want to execute the report', type=int)
+
+    table = db.report_longest_streak_given_habit(id_habit, row_factory=as_array)
+    print(format_table(table, STREAK_HEADERS))
+
+
+def _report_longest_streak():
+    """ Prints the longest run streak of all defined habits."""
+    db = get_db()
+    table = db.report_longest_streak(row_factory=as_array)
+    print(format_table(table, STREAK_HEADERS))
+
+
+def _report_shortest_streak():
+    """ Prints the shortest run streak of all defined habits."""
+    db = get_db()
+    table = db.report_shortest_streak(row_factory=as_array)
+    print(format_table(table, STREAK_HEADERS))
+
+
+def _unknown_report():
+    """ Fallback for report IDs that are not in the menu."""
+    print('There is no report with that ID.')
+
+
+# Menu entries and their report functions; extending the reports only needs a
+# new entry here.
+REPORTS = {
+    1: ('Your current streak overview', _report_streak_overview),
+    2: ('List all habits with the same periodicity', _report_same_period),
+    3: ('Longest run streak for a given habit', _report_longest_streak_given_habit),
+    4: ('Longest run streak of all defined habits', _report_longest_streak),
+    5: ('Shortest run streak of all defined habits', _report_shortest_streak),
+}
+
+# The menu never changes at runtime, so it is rendered once at import time
+# instead of rebuilding the table string on every invocation.
+MENU = format_table(
+    [[report_id, name] for report_id, (name, _) in REPORTS.items()],
+    ("Report ID", "Report Name"))
 
 
 @cli.command()
@@ -17,78 +90,15 @@ def analyse_data():
     Generate and display reports.
 
     The `analyse_data()` function displays a list of available reports and prompts the user
-    to select a report to execute. It then uses the appropriate methods of the `db` object to
-    retrieve and format the data for the selected report, using the `tabulate()` function from
-    the `tabulate` library. The available reports include listing all habits, listing habits
-    with the same periodicity, finding the longest and shortest run streaks for all habits,
-    finding the longest run streak for a given habit, and getting a snapshot of the habit list.
+    to select a report to execute. Each report lives in its own `_report_*` function and is
+    dispatched through the `REPORTS` table, so the command body stays a lookup instead of a
+    `match` with per-arm table construction. The available reports include listing all habits,
+    listing habits with the same periodicity, finding the longest and shortest run streaks for
+    all habits, finding the longest run streak for a given habit, and getting a snapshot of
+    the habit list.
     """
-    table = [
-        ['1', 'Your current streak overview'],
-        ['2', 'List all habits with the same periodicity'],
-        ['3', 'Longest run streak for a given habit'],
-        ['4', 'Longest run streak of all defined habits'],
-        ['5', 'Shortest run streak of all defined habits'],
-    ]
-    print(tabulate(
-        table,
-        tablefmt="fancy_outline",
-        headers=["Report ID", "Report Name"]))
-    match click.prompt('Please provide the Report ID of the report you want to execute', type=int):
-        case 1:
-            print(tabulate(
-                [h.as_tabulate() for h in Habit.objects()],
-                tablefmt="fancy_outline",
-                headers=["ID", "Name", "Periodicity", "Streak", "Tasks", "Completed"]
-            ))
-
-        case 2:
-            periodicity_options = [
-                v.name for v in list(Periodicity)
-            ]
-            periodicity = click.prompt(
-                'Please enter the habit Periodicity',
-                type=click.Choice(periodicity_options, case_sensitive=False)
-            )
-            table = db.report_same_period(periodicity, row_factory=as_array)
-
-            print(tabulate(
-                table,
-                tablefmt="fancy_outline",
-                headers=["Periodicity", "Habit Name"]))
-
-        case 3:
-
-            table = db.get_habit_list_snapshot(row_factory=as_array)
-            print(tabulate(
-                table,
-                tablefmt="fancy_outline",
-                headers=["Habit ID", "Habit Name"]))
-
-            id_habit = click.prompt(
-                'Please provide the Habit ID for which you want to execute the report', type=int)
-
-            table = db.report_longest_streak_given_habit(id_habit, row_factory=as_array)
-
-            print(tabulate(
-                table,
-                tablefmt="fancy_outline",
-                headers=["Habit Name", "Streak"]))
-
-        case 4:
-
-            table = db.report_longest_streak(row_factory=as_array)
-
-            print(tabulate(
-                table,
-                tablefmt="fancy_outline",
-                headers=["Habit Name", "Streak"]))
-
-        case 5:
-
-            table = db.report_shortest_streak(row_factory=as_array)
-
-            print(tabulate(
-                table,
-                tablefmt="fancy_outline",
-                headers=["Habit Name", "Streak"]))
+    print(MENU)
+    choice = click.prompt('Please provide the Report ID of the report you want to execute',
+                          type=int)
+    _, report = REPORTS.get(choice, (None, _unknown_report))
+    report()
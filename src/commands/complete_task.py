@@ -3,14 +3,30 @@ This command allows users to select the tasks from a list of habits and tasks an
 completed, either by providing task ids one by one or a list of multiple tasks.
 """
 
+import sys
+from itertools import groupby
+from operator import itemgetter
+
 import click
 
 from cli import cli
-from database import Task
+from database import get_db, as_row
+
+# Task line templates, parsed once at import instead of as a fresh f-string
+# per row.
+_CHECKED = '- [x] [{}] {}'
+_UNCHECKED = '- [ ] [{}] {}'
 
 
 @cli.command()
-def complete_task():
+@click.option('--limit', default=100, show_default=True,
+              help='Maximum number of tasks to display.')
+@click.option('--offset', default=0, show_default=True,
+              help='Number of tasks to skip.')
+@click.option('--id', 'id_tasks', multiple=True, type=int,
+              help='ID of a task to mark completed; repeat for several '
+                   'tasks. Skips the listing and the interactive prompts.')
+def complete_task(limit, offset, id_tasks):
     """
     Mark tasks as completed.
 
@@ -24,22 +40,38 @@ def complete_task():
     database module is called to update the completed status of the task in the database.
 
     The user is then prompted to mark another task as completed, and the process
-    repeats until they choose not to.
+    repeats until they choose not to. Scripted callers can pass repeated
+    `--id` options instead, which go straight to the batched update without
+    the listing or the prompt loop.
     """
-    last_habit = None
-    for task in Task.objects():
-        print(task.habit())
-        habit_name = task.habit().name
-        if last_habit != habit_name:
-            print(habit_name)
-        checked = 'x' if task.completed else ' '
-        print(f"- [{checked}] [{task.id_task}] {task.task}")
-        last_habit = habit_name
+    db = get_db()
+    if id_tasks:
+        db.update_completed(list(id_tasks))
+        return
+    # The listing is accumulated and written once: one syscall for the
+    # whole page instead of a locked, flushed print per task line. The
+    # rows arrive ordered by habit, so groupby yields one header per
+    # habit without a per-row name comparison.
+    out = []
+    tasks = db.iter_tasks_with_habit(row_factory=as_row,
+                                     limit=limit, offset=offset)
+    for habit_name, rows in groupby(tasks, key=itemgetter('name')):
+        out.append(habit_name)
+        for row in rows:
+            line = _CHECKED if row['completed'] else _UNCHECKED
+            out.append(line.format(row['id_task'], row['task']))
+    shown = sum(1 for line in out if line.startswith('- '))
+    total = db.count_tasks()
+    if shown < total:
+        out.append(f'Showing {shown} of {total} tasks '
+                   f'(use --limit/--offset to page).')
+    if out:
+        sys.stdout.write('\n'.join(out) + '\n')
+    pending_ids = []
     while True:
         id_task = click.prompt('Please provide the task ID you want to mark as completed', type=int)
         if id_task:
-            task = Task.get(id_task)
-            task.completed = True
-            task.save()
+            pending_ids.append(id_task)
         if not click.confirm('Do you want to select another one?'):
             break
+    db.update_completed(pending_ids)
@@ -6,11 +6,16 @@ a series of prompts to get the correct information when creating the habit.
 import click
 
 from cli import cli
-from database import Habit, Periodicity
+from database import Habit, Task, get_db
+
+from ._common import PERIODICITY_CHOICE
 
 
 @cli.command()
-def create_habit():
+@click.option('--task', '-t', 'tasks', multiple=True,
+              help='Task for the habit template; repeat for several tasks. '
+                   'Skips the interactive task prompts.')
+def create_habit(tasks):
     """
     Create new habits here.
 
@@ -18,25 +23,28 @@ def create_habit():
     When this command is executed, it prompts the user to enter a new habit name,
     a periodicity for the habit, and a task template for the habit. The
     periodicity is chosen from a list of predefined options, and the task
-    template is a list of tasks that the user can add to.
-    The `create_habit` function then calls the `create_habit` method of the
-    `db` object, passing in the user's input as arguments.
-    This method creates a new habit in the database with the specified name,
-    periodicity, and task template.
+    template is a list of tasks that the user can add to. Scripted callers can
+    pass the template up front with repeated `--task` options, replacing the
+    prompt-and-confirm round trip per task with a single invocation.
+    The habit and its first batch of tasks are then written inside one
+    transaction, so the new habit is immediately ready to track and never
+    exists half-created, and the whole creation costs a single commit.
     """
     name = click.prompt('Please enter a new Habit name', type=str)
 
-    periodicity_options = [
-        v.name for v in list(Periodicity)
-    ]
     periodicity = click.prompt(
         'Please enter the habit Periodicity',
-        type=click.Choice(periodicity_options, case_sensitive=False)
+        type=PERIODICITY_CHOICE
     )
 
-    task_template = []
-    while True:
-        task_template.append(click.prompt('Please provide the task for your habit', type=str))
-        if not click.confirm('Do you want to add more tasks?'):
-            break
-    Habit(name, Periodicity[periodicity.upper()], task_template).save()
+    task_template = list(tasks)
+    if not task_template:
+        while True:
+            task_template.append(
+                click.prompt('Please provide the task for your habit', type=str))
+            if not click.confirm('Do you want to add more tasks?'):
+                break
+    db = get_db()
+    with db.transaction():
+        habit = Habit(name, periodicity, task_template, db=db).save()
+        Task.from_habit(habit, db=db)
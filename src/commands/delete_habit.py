@@ -4,14 +4,18 @@ habit to be deleted.
 As soon as that is provided and action confirmed, the habit and all of its tasks are deleted.
 """
 import click
-from tabulate import tabulate
 
 from cli import cli
-from database import Habit
+from database import get_db, as_array
+
+from ._common import habit_table
 
 
 @cli.command()
-def delete_habit():
+@click.option('--id', 'id_habits', multiple=True, type=int,
+              help='ID of a habit to delete; repeat for several habits. '
+                   'Skips the interactive prompts and confirmations.')
+def delete_habit(id_habits):
     """
     Delete existing habits.
 
@@ -26,21 +30,33 @@ def delete_habit():
     If the user confirms that they want to delete another habit, the process starts over.
 
     The `delete_habit` function recursively deletes all tasks belonging to the
-    provided habit, and then deletes the habit itself.
+    provided habit, and then deletes the habit itself. Scripted callers can
+    pass repeated `--id` options instead, which go straight to the batched
+    delete without the listing or the per-habit confirmations.
     """
+    db = get_db()
+    if id_habits:
+        db.delete_habits(id_habits)
+        return
     print("Here is the list of currently active habits:")
-    table = [item.as_tabulate() for item in Habit.objects()]
-    print(tabulate(
-        table,
-        tablefmt="fancy_outline",
-        headers=["ID", "Name", "Periodicity", "Streak", "Tasks", "Completed"]
-    ))
+    # The fetched rows double as a local cache: habits picked for deletion
+    # are dropped from it, so showing the remaining habits needs no
+    # re-query.
+    table = db.habit_overview_rows(row_factory=as_array)
+    print(habit_table(table))
+    # Confirmed IDs are collected and flushed as one DELETE ... IN (...)
+    # after the loop, so N deletions cost one statement and one commit.
+    to_delete = []
     while True:
         id_habit = click.prompt('Please type the ID of the habit you want to delete', type=int)
         if click.confirm(
                 f'Are you sure you want to delete the Habit with ID: {id_habit}? '
                 'Please note that this will recursively delete all tasks belonging to '
                 'the provided habit!'):
-            Habit.delete(id_habit)
+            to_delete.append(id_habit)
+            table = [row for row in table if row[0] != id_habit]
         if not click.confirm('Do you want to delete another one?'):
             break
+        if click.confirm('Do you want to see the remaining habits?'):
+            print(habit_table(table))
+    db.delete_habits(to_delete)
@@ -2,14 +2,20 @@
 This command generates a list of habits with their main attributes.
 """
 
-from tabulate import tabulate
+import click
 
 from cli import cli
-from database import Habit
+from database import get_db, as_array
+
+from ._common import habit_table
 
 
 @cli.command()
-def list_habits():
+@click.option('--limit', default=100, show_default=True,
+              help='Maximum number of habits to display.')
+@click.option('--offset', default=0, show_default=True,
+              help='Number of habits to skip.')
+def list_habits(limit, offset):
     """
     Display an overview of all habits.
 
@@ -25,9 +31,15 @@ def list_habits():
     style, and the headers for the table are specified as well.
     The resulting table is printed to the console.
     """
-    table = [item.as_tabulate() for item in Habit.objects()]
-    print(tabulate(
-        table,
-        tablefmt="fancy_outline",
-        headers=["ID", "Name", "Periodicity", "Streak", "Tasks", "Completed"]
-    ))
+    db = get_db()
+    # Paging caps the query and the render at the page size, and the rows
+    # stream straight into the renderer instead of through a full list.
+    table = db.iter_habit_overview_rows(row_factory=as_array,
+                                        limit=limit, offset=offset)
+    print(habit_table(table))
+    total = db.count_habits()
+    shown = max(0, total - offset) if limit < 0 \
+        else max(0, min(limit, total - offset))
+    if shown < total:
+        print(f'Showing {shown} of {total} habits '
+              f'(use --limit/--offset to page).')
@@ -6,7 +6,7 @@ templates provided in the habit creation so that you can follow up on the progre
 """
 
 from cli import cli
-from database import Task, Habit, Report
+from database import Task, Habit, Report, get_db
 
 
 @cli.command()
@@ -15,23 +15,27 @@ def sync_tasks():
     Generate tasks and fill in report data automatically.
 
     This code defines a command-line interface (CLI) command called `sync_tasks`.
-    When this command is executed, it performs the following actions:
-    1. It loops through all the habits in the database and checks if any of them
-    have tasks that need to be completed. If a habit has incomplete tasks,
-    it generates a report for that habit using the `generate_report` function.
+    When this command is executed, it loops once over all habits together with
+    their sync flags and performs the following actions:
+    1. For habits whose period is over or whose tasks are all completed, it
+    generates a report entry capturing the finished period. The report resets
+    the habit's tasks in place for the new period, so no re-insertion from the
+    template is needed.
 
-    2. It then loops through all the habits in the database and creates new tasks
-    for any habit that needs to be fulfilled. It does this by looping through the
-    habit's task template and creating a new task for each task in the template
-    using the `create_task` function.
+    2. For habits without any tasks yet, it creates the tasks from the habit's
+    task template.
 
     Overall, this command is intended to synchronize the tasks for all habits in
     the database with the tasks defined in the habit templates.
     It also generates reports for any incomplete habits and creates new tasks
     for any habit that needs to be fulfilled.
     """
-    for habit in Habit.objects(finished=True):
-        Report(habit.id_habit).generate()
-
-    for habit in Habit.objects(no_tasks=True):
-        Task.from_habit(habit)
+    db = get_db()
+    # One transaction around the whole sync: the per-habit reports and task
+    # batches nest inside it, so the run lands with a single commit.
+    with db.transaction():
+        for habit, finished, needs_tasks in Habit.objects_needing_sync(db=db):
+            if finished:
+                Report(habit.id_habit, db=db).generate()
+            if needs_tasks:
+                Task.from_habit(habit, db=db)
@@ -5,14 +5,22 @@ from datetime import datetime, timedelta
 
 from faker import Faker
 
-from database import Habit, Task, Report, Periodicity
+from database import DATE_FORMAT, get_db, Habit, Task, Report, Periodicity
 
+db = get_db()
 fake = Faker()
 Faker.seed(1)
 
 current_time = datetime.now()
 start_time = current_time - timedelta(days=30)
 
+# One SQL text for every task insert: sqlite3 caches compiled statements by
+# their exact text, so the 30-day loop reuses one prepared statement instead
+# of re-parsing the INSERT on each call.
+TASK_INSERT_SQL = (
+    'INSERT INTO tasks (id_habit, task, completed, created_at, updated_at) '
+    'VALUES (?, ?, FALSE, ?, ?)')
+
 
 def main():
     """
@@ -28,50 +36,52 @@ def main():
         None
     """
     print('Deleting old database entries ...')
-    for report in Report.objects():
-        report.delete()
-    for task in Task.objects():
-        task.delete()
-    for habit in Habit.objects():
-        habit.delete()
+    with db.transaction():
+        db.cursor.execute('DELETE FROM streak_stats')
+        db.cursor.execute('DELETE FROM reports')
+        db.cursor.execute('DELETE FROM tasks')
+        db.cursor.execute('DELETE FROM habits')
     # generate initial habits and first batch of tasks
     print('Generate initial habits and first batch of tasks ...')
 
-    for periodicity in [Periodicity.DAILY, Periodicity.WEEKLY, Periodicity.MONTHLY]:
-        for _ in range(10):
-            habit = Habit(
-                name=fake.sentence(nb_words=4),
-                periodicity=periodicity,
-                template=fake.texts(nb_texts=5, max_nb_chars=40),
-                created_at=start_time,
-                updated_at=start_time
-            ).save()
-            generate_tasks(habit, start_time)
+    # One transaction for the whole seed batch: 30 habit inserts plus their
+    # task batches land with a single commit instead of one fsync each.
+    with db.transaction():
+        for periodicity in [Periodicity.DAILY, Periodicity.WEEKLY, Periodicity.MONTHLY]:
+            for _ in range(10):
+                habit = Habit(
+                    name=fake.sentence(nb_words=4),
+                    periodicity=periodicity,
+                    template=fake.texts(nb_texts=5, max_nb_chars=40),
+                    created_at=start_time,
+                    updated_at=start_time
+                ).save()
+                generate_tasks(habit, start_time)
     # simulate user input and report generation for the next 30 days.
     print('Simulating user input and report generation for the next 30 days ...')
     for delta in range(30):
         delta_time = start_time + timedelta(days=delta)
         task_list = list(Task.objects())
-        # complete a few random tasks
-        for _ in range(120):
-            task = random.choice(task_list)
-            task_list.remove(task)
-            task.completed = True
-            task.updated_at = delta_time
-            task.save()
-        # Create a report of the finished periodicity habits and tasks
+        # complete a few random tasks in one batched update
+        chosen = random.sample(task_list, min(120, len(task_list)))
+        with db.transaction():
+            db.cursor.executemany(
+                'UPDATE tasks SET completed = TRUE, updated_at = ? WHERE id_task = ?',
+                [(delta_time.strftime(DATE_FORMAT), task.id_task) for task in chosen])
+        # Create a report of the finished periodicity habits and tasks. The
+        # report resets the tasks in place, so no fresh batch is inserted.
         print(f'Create a report on day {delta_time.strftime("%Y-%m-%d")} ...')
         for habit in Habit.objects(timestamp=delta_time):
             Report(habit.id_habit, created_at=delta_time).generate()
-            generate_tasks(habit, delta_time)
 
 
 def generate_tasks(habit, timestamp):
     """
         Generates and saves tasks based on a given habit and timestamp.
 
-        This function generates individual tasks from the provided habit's template and
-        saves them with the specified timestamp as their creation and update time.
+        This function generates the tasks from the provided habit's template and
+        saves them in one batch with the specified timestamp as their creation
+        and update time.
 
         Args:
 
@@ -86,8 +96,11 @@ def generate_tasks(habit, timestamp):
             of tasks to be generated.
         """
 
-    for task in habit.template:
-        Task(habit.id_habit, task, created_at=timestamp, updated_at=timestamp).save()
+    stamp = timestamp.strftime(DATE_FORMAT)
+    with db.transaction():
+        db.cursor.executemany(
+            TASK_INSERT_SQL,
+            [(habit.id_habit, task, stamp, stamp) for task in habit.template])
 
 
 if __name__ == "__main__":
@@ -1,14 +1,95 @@
 """
 The database module: Primarily creates database tables, stores information and returns data.
 """
-import json
 import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from .types import Periodicity
 
 DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 DB_PATH = Path(__file__).parent.parent.parent.resolve()
 
+# Stored timestamps follow DATE_FORMAT, which is ISO-8601 with a space
+# separator, so rows can be parsed with the C-implemented fromisoformat
+# instead of the pure-Python strptime; bound once to skip the attribute
+# lookup in the per-row mapping loops.
+parse_timestamp = datetime.fromisoformat
+
+
+def format_timestamp(stamp: datetime) -> str:
+    """Render a datetime in DATE_FORMAT via the C-implemented isoformat.
+
+    `isoformat(sep=' ', timespec='seconds')` produces exactly the
+    DATE_FORMAT text but skips strftime's format-string interpretation,
+    which matters in the per-task serialization loops.
+    """
+    return stamp.isoformat(sep=' ', timespec='seconds')
+
+# The query texts are hoisted to module level: sqlite3's statement cache is
+# keyed by the exact SQL string, so reusing one constant per query keeps the
+# compiled statement warm instead of re-parsing per call.
+_SQL_HABIT_OVERVIEW = '''
+    SELECT h.id_habit, h.name, h.periodicity, h.streak,
+        COUNT(t.id_task) as tasks, SUM(t.completed) as tasks_completed
+    FROM habits h LEFT JOIN tasks t USING(id_habit)
+    GROUP BY h.id_habit
+    ORDER BY h.id_habit LIMIT ? OFFSET ?;'''
+
+_SQL_TASKS_WITH_HABIT = '''
+    SELECT habits.name, tasks.id_task, tasks.task, tasks.completed
+    FROM tasks JOIN habits USING(id_habit) ORDER BY habits.name
+    LIMIT ? OFFSET ?;'''
+
+_SQL_COUNT_HABITS = 'SELECT COUNT(*) FROM habits'
+_SQL_COUNT_TASKS = 'SELECT COUNT(*) FROM tasks'
+
+_SQL_UPDATE_COMPLETED = '''
+    UPDATE tasks SET completed = TRUE,
+    updated_at = ? WHERE id_task = ?'''
+
+_SQL_SAME_PERIOD = '''SELECT periodicity, name FROM habits where periodicity = ?;'''
+
+# Precomputed name-to-stored-value mapping for the periodicity filter: one
+# dict lookup per call instead of an enum __getitem__ plus attribute access,
+# and a plain KeyError on bad input before any SQL is touched.
+_PERIOD_LOOKUP = {
+    name.lower(): member.value for name, member in Periodicity.__members__.items()}
+
+# The streak reports read the trigger-maintained streak_stats table (one row
+# per habit) instead of aggregating the ever-growing reports history.
+_SQL_LONGEST_STREAK = '''
+    SELECT name, MAX(longest) as "Highest Streak" FROM streak_stats;'''
+
+_SQL_SHORTEST_STREAK = '''
+    SELECT name, MIN(shortest) as "Highest Streak" FROM streak_stats WHERE
+    shortest IS NOT NULL;'''
+
+_SQL_LONGEST_STREAK_GIVEN_HABIT = '''
+    SELECT name, MAX(longest) as "Highest Streak"
+    FROM streak_stats where id_habit = ?;'''
+
+_SQL_HABIT_LIST_SNAPSHOT = '''
+    select id_habit, name  from reports r group by id_habit;'''
+
+_SQL_STREAK_STATS = '''
+    SELECT MAX(longest) as longest_all,
+        MIN(shortest) as shortest_all,
+        MAX(CASE WHEN id_habit = ? THEN longest END) as longest_for_habit
+    FROM streak_stats;'''
+
+
+@lru_cache(maxsize=None)
+def _field_names(description):
+    """ Returns the column names for a cursor description.
+
+    Cached because the description is identical for every row of a result
+    set (and for every run of the same query), while `as_dictionary` is
+    called once per row."""
+
+    return tuple(column[0] for column in description)
+
 
 def as_dictionary(cursor, row):
     """
@@ -19,13 +100,17 @@ def as_dictionary(cursor, row):
         * row (tuple): The values of a database row.
     Returns: dict: A dictionary mapping column names to row values."""
 
-    fields = [column[0] for column in cursor.description]
-    data = dict(zip(fields, row))
-    if 'template' in data:
-        data['template'] = json.loads(data.get('template'))
+    data = dict(zip(_field_names(cursor.description), row))
     return data
 
 
+# sqlite3.Row is a C-level row factory: rows support index and column-name
+# access without building a Python dict per row, which makes it the default
+# throughout the module; `as_dictionary` stays available as an explicit
+# opt-in for callers that need a real dict.
+as_row = sqlite3.Row
+
+
 def as_array(_cursor, row):
     """ A simple function that returns the input row as-is.
 
@@ -37,6 +122,24 @@ def as_array(_cursor, row):
     return row
 
 
+_db = None
+
+
+def get_db() -> 'DB':
+    """ Returns the shared DB instance, creating it on first use.
+
+    Every command module used to open its own connection at import time even
+    though Click only ever dispatches one command per process. Resolving the
+    connection lazily through this helper means one connection is opened, and
+    only once a command actually touches the database. The dataclasses in
+    this package resolve their `db` defaults through it as well, so merely
+    importing them never opens a connection."""
+    global _db
+    if _db is None:
+        _db = DB()
+    return _db
+
+
 class DB:
     """ Represents a database module that handles habit tracking data.
 
@@ -46,17 +149,48 @@ class DB:
 
     def __init__(self, name="habit_tracking_app.db"):
         """ Creates a database connection and sets the row factory.
+
+        WAL journaling means the database file gains `-wal`/`-shm` sibling
+        files while a connection is open; they belong to SQLite and must be
+        kept next to the database.
+
         Args:
             name (str, optional): The name of the database to create or connect with.
+            Pass ":memory:" for a private in-memory database.
             Defaults to "habit_tracking_app.db"."""
 
-        self.connection = sqlite3.connect(f'{DB_PATH}/{name}')
+        path = name if name == ':memory:' else f'{DB_PATH}/{name}'
+        self._in_transaction = False
+        self._row_factory = None
+        self.cursor = None
+        # isolation_level=None puts the connection in autocommit: single
+        # statements are durable on their own without the implicit
+        # BEGIN/COMMIT pair the driver otherwise wraps around DML, and
+        # batches take an explicit BEGIN IMMEDIATE via transaction().
+        self.connection = sqlite3.connect(
+            path, isolation_level=None, cached_statements=256)
+        self.connection.execute('''PRAGMA journal_mode = WAL;''')
+        self.connection.execute('''PRAGMA synchronous = NORMAL;''')
+        self.connection.execute('''PRAGMA temp_store = MEMORY;''')
+        self.connection.execute('''PRAGMA cache_size = -65536;''')
+        self.connection.execute('''PRAGMA mmap_size = 268435456;''')
+        self.connection.execute('''PRAGMA busy_timeout = 30000;''')
+        self.connection.execute('''PRAGMA foreign_keys = ON;''')
         self._set_row_factory()
         self._migrate()
 
+    # Bump whenever _migrate gains DDL; PRAGMA user_version stores the value
+    # a database was last migrated to, letting subsequent opens skip the
+    # CREATE statements entirely.
+    _SCHEMA_VERSION = 6
+
     def _migrate(self):
         """ Migrates the database schema to create required tables.
 
+        Once a database reports the current schema version through
+        `PRAGMA user_version`, the whole DDL block is skipped, so opening an
+        existing database costs the pragmas and nothing else.
+
         The 'habits' table consists of the following columns:
             - id_habit (int): Primary key representing habit ID.
             - name (str): Name of the habit.
@@ -84,7 +218,9 @@ class DB:
             - created_at (timestamp): Date and time of report creation.
             - raw_data (str): JSON string representing the list of task dictionaries."""
 
-        self.cursor.execute('''PRAGMA foreign_keys = ON;''')
+        version = self.cursor.execute('''PRAGMA user_version;''').fetchone()[0]
+        if version == self._SCHEMA_VERSION:
+            return
 
         self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS habits (
@@ -97,44 +233,334 @@ class DB:
                 updated_at timestamp DATE DEFAULT (datetime('now','localtime'))
            )''')
 
-        self.cursor.execute('''
+        create_tasks = '''
             CREATE TABLE IF NOT EXISTS tasks (
-                id_task INTEGER PRIMARY KEY AUTOINCREMENT, 
-                id_habit INTEGER NOT NULL, 
+                id_task INTEGER PRIMARY KEY AUTOINCREMENT,
+                id_habit INTEGER NOT NULL,
                 task NOT NULL,
                 completed BOOL NOT NULL DEFAULT FALSE,
-                created_at timestamp DATE DEFAULT (datetime('now','localtime')), 
+                created_at timestamp DATE DEFAULT (datetime('now','localtime')),
                 updated_at timestamp DATE DEFAULT (datetime('now','localtime')),
                 FOREIGN KEY (id_habit) REFERENCES habits(id_habit)
+                    ON DELETE CASCADE
             )
-        ''')
-
-        self.cursor.execute('''
+        '''
+        # Databases from before the FK cascaded need the documented rebuild
+        # (rename, recreate, copy, drop) exactly once; the dropped table
+        # takes its old indexes and trigger with it, and they are recreated
+        # below.
+        legacy = self.cursor.execute(
+            '''SELECT sql FROM sqlite_master
+            WHERE type = 'table' AND name = 'tasks';''').fetchone()
+        if legacy and 'ON DELETE CASCADE' not in legacy[0]:
+            self.cursor.execute('''ALTER TABLE tasks RENAME TO tasks_legacy;''')
+            self.cursor.execute(create_tasks)
+            self.cursor.execute('''INSERT INTO tasks SELECT * FROM tasks_legacy;''')
+            self.cursor.execute('''DROP TABLE tasks_legacy;''')
+        else:
+            self.cursor.execute(create_tasks)
+
+        # Reports carry no foreign key: they are the habit's history and
+        # outlive it, and with foreign_keys = ON a plain reference would
+        # block the habit's deletion. Databases that still have the old
+        # referencing table get the same one-time rebuild as tasks above.
+        create_reports = '''
             CREATE TABLE IF NOT EXISTS reports (
-                id_report INTEGER PRIMARY KEY AUTOINCREMENT, 
-                id_habit INTEGER NOT NULL, 
+                id_report INTEGER PRIMARY KEY AUTOINCREMENT,
+                id_habit INTEGER NOT NULL,
                 name VARCHAR(255) NOT NULL,
                 current_streak INT,
                 completed_tasks_count TEXT NOT NULL,
                 uncompleted_tasks_count TEXT NOT NULL,
                 created_at timestamp DATE DEFAULT (datetime('now','localtime')),
-                raw_data TEXT NOT NULL, --list of dicts of tasks
-                FOREIGN KEY (id_habit) REFERENCES habits(id_habit)
+                raw_data TEXT NOT NULL --list of dicts of tasks
             )
-        ''')
+        '''
+        legacy = self.cursor.execute(
+            '''SELECT sql FROM sqlite_master
+            WHERE type = 'table' AND name = 'reports';''').fetchone()
+        if legacy and 'FOREIGN KEY' in legacy[0]:
+            self.cursor.execute(
+                '''ALTER TABLE reports RENAME TO reports_legacy;''')
+            self.cursor.execute(create_reports)
+            self.cursor.execute(
+                '''INSERT INTO reports SELECT * FROM reports_legacy;''')
+            self.cursor.execute('''DROP TABLE reports_legacy;''')
+        else:
+            self.cursor.execute(create_reports)
+
+        # The rest of the schema is one-shot DDL without parameters, so it
+        # runs as a single script: one parse pass and one Python-to-C round
+        # trip instead of one per statement.
+        #
+        # The hot queries filter and join on the indexed columns; without
+        # the indexes every lookup scans the full table. The compound
+        # (id_habit, completed) index covers the completion counts, and the
+        # partial indexes over each completion state let the "any
+        # uncompleted task left?" probes touch only the relevant leaf pages.
+        self.cursor.executescript('''
+            CREATE INDEX IF NOT EXISTS idx_tasks_id_habit ON tasks(id_habit);
+            CREATE INDEX IF NOT EXISTS idx_tasks_habit_completed
+                ON tasks(id_habit, completed);
+            CREATE INDEX IF NOT EXISTS idx_reports_id_habit ON reports(id_habit);
+            CREATE INDEX IF NOT EXISTS idx_habits_periodicity
+                ON habits(periodicity, updated_at);
+            CREATE INDEX IF NOT EXISTS idx_reports_streak
+                ON reports(current_streak);
+            CREATE INDEX IF NOT EXISTS idx_tasks_uncomp
+                ON tasks(id_habit) WHERE completed = 0;
+            CREATE INDEX IF NOT EXISTS idx_tasks_comp
+                ON tasks(id_habit) WHERE completed = 1;''')
+
+        # streak_stats is an incrementally maintained aggregate over the
+        # reports history: one row per habit with its best and its shortest
+        # non-zero streak, kept current by the insert trigger and backfilled
+        # for databases that already carry report history. The streak
+        # reports become O(habits) lookups instead of scans over the
+        # unbounded reports table.
+        #
+        # The second trigger keeps habits.updated_at in step with task
+        # inserts, since inserting tasks starts a new tracking period for
+        # their habit.
+        self.cursor.executescript(f'''
+            CREATE TABLE IF NOT EXISTS streak_stats (
+                id_habit INTEGER PRIMARY KEY,
+                name VARCHAR(255) NOT NULL,
+                longest INT DEFAULT 0,
+                shortest INT
+            );
+
+            CREATE TRIGGER IF NOT EXISTS trg_reports_stats
+            AFTER INSERT ON reports FOR EACH ROW
+            BEGIN
+                INSERT INTO streak_stats (id_habit, name, longest, shortest)
+                VALUES (NEW.id_habit, NEW.name, NEW.current_streak,
+                    NULLIF(NEW.current_streak, 0))
+                ON CONFLICT(id_habit) DO UPDATE SET
+                    name = NEW.name,
+                    longest = MAX(longest, NEW.current_streak),
+                    shortest = CASE WHEN NEW.current_streak > 0
+                        THEN MIN(COALESCE(shortest, NEW.current_streak),
+                            NEW.current_streak)
+                        ELSE shortest END;
+            END;
+
+            INSERT INTO streak_stats (id_habit, name, longest, shortest)
+            SELECT id_habit, name, MAX(current_streak),
+                MIN(NULLIF(current_streak, 0))
+            FROM reports GROUP BY id_habit
+            ON CONFLICT(id_habit) DO NOTHING;
+
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_touch_habit
+            AFTER INSERT ON tasks FOR EACH ROW
+            BEGIN
+                UPDATE habits SET updated_at = NEW.created_at
+                WHERE id_habit = NEW.id_habit;
+            END;
+
+            PRAGMA user_version = {self._SCHEMA_VERSION};''')
         self.connection.commit()
 
-    def _set_row_factory(self, row_factory=as_dictionary):
+    @contextmanager
+    def transaction(self):
+        """ Groups several writes into a single transaction.
+
+        The connection runs in autocommit, so a batch opens an explicit
+        BEGIN IMMEDIATE (taking the write lock up front) and commits once on
+        exit, or rolls back if the block raises. The save/delete methods on
+        Habit, Task and Report still call `commit()`, which is a no-op both
+        inside a block and in plain autocommit. Nested blocks join the
+        outermost one."""
+
+        if self._in_transaction:
+            yield
+            return
+        self._in_transaction = True
+        self.cursor.execute('''BEGIN IMMEDIATE;''')
+        try:
+            yield
+        except BaseException:
+            self.connection.rollback()
+            raise
+        else:
+            self.connection.commit()
+        finally:
+            self._in_transaction = False
+
+    def commit(self):
+        """ Kept as the flush point the model classes call after writing.
+
+        In autocommit mode single statements are already durable, and inside
+        a `transaction()` block the boundary belongs to the block, so in
+        both cases this costs nothing."""
+
+        if not self._in_transaction:
+            self.connection.commit()
+
+    def _set_row_factory(self, row_factory=as_row):
         """ Sets the row factory for the database connection.
 
+        The persistent cursor is reused and the assignment is skipped when the
+        factory is unchanged, so repeated reads with the same factory neither
+        churn Cursor objects nor cool the statement cache.
+
         Args:
             row_factory (function, optional): The function to use as the row factory.
-            Defaults to `as_dictionary`."""
+            Defaults to `as_row`."""
 
+        if row_factory is self._row_factory:
+            return
+        self._row_factory = row_factory
         self.connection.row_factory = row_factory
-        self.cursor = self.connection.cursor()
+        if self.cursor is None:
+            self.cursor = self.connection.cursor()
+        else:
+            self.cursor.row_factory = row_factory
+
+    def habit_overview_rows(self, row_factory=as_row, limit=-1, offset=0):
+        """ Returns the habit overview used by the habit listing commands.
+
+        One aggregating query computes the task and completed-task counts for
+        every habit, instead of hydrating a Habit object per row and running
+        a COUNT query for each of them.
+
+        Args:
+            row_factory (function, optional): The function to use as the row factory.
+            Defaults to `as_row`.
+            limit (int, optional): Maximum number of habit rows to return;
+            -1 returns all. Defaults to -1.
+            offset (int, optional): Number of habit rows to skip.
+            Defaults to 0.
 
-    def report_same_period(self, periodicity: str, row_factory=as_dictionary):
+        Returns:
+            list: One row per habit with id_habit, name, periodicity, streak,
+            the number of tasks and the number of completed tasks."""
+
+        return list(self.iter_habit_overview_rows(
+            row_factory=row_factory, limit=limit, offset=offset))
+
+    def iter_habit_overview_rows(self, row_factory=as_row, batch_size=256,
+                                 limit=-1, offset=0):
+        """ Streams the habit overview rows instead of materializing them.
+
+        The renderers accept any iterable, so feeding them the generator
+        keeps one copy of the rows in flight (the renderer's own buffer)
+        rather than a full list alongside it.
+
+        Args:
+            row_factory (function, optional): The function to use as the row factory.
+            Defaults to `as_row`.
+            batch_size (int, optional): How many rows to fetch per batch.
+            Defaults to 256.
+            limit (int, optional): Maximum number of habit rows to yield;
+            -1 yields all. Defaults to -1.
+            offset (int, optional): Number of habit rows to skip.
+            Defaults to 0.
+
+        Yields:
+            One row per habit with id_habit, name, periodicity, streak,
+            the number of tasks and the number of completed tasks."""
+
+        cursor = self.connection.cursor()
+        cursor.row_factory = row_factory
+        cursor.execute(_SQL_HABIT_OVERVIEW, [limit, offset])
+        while rows := cursor.fetchmany(batch_size):
+            yield from rows
+
+    def delete_habits(self, id_habits):
+        """ Deletes the given habits in one statement and one transaction.
+
+        The tasks go with their habits through the ON DELETE CASCADE on the
+        foreign key, so a batch of N confirmed deletions costs a single
+        WAL flush instead of one commit per habit. Report history (and the
+        streak statistics derived from it) is kept, matching the
+        single-habit delete.
+
+        Args:
+            id_habits (iterable): The IDs of the habits to delete.
+
+        Returns:
+            None
+        """
+        id_habits = list(id_habits)
+        if not id_habits:
+            return
+        placeholders = ', '.join('?' * len(id_habits))
+        with self.transaction():
+            self.cursor.execute(
+                f'DELETE FROM habits WHERE id_habit IN ({placeholders})',
+                id_habits)
+
+    def count_habits(self) -> int:
+        """ Returns the total number of habits with one COUNT query."""
+        return self.cursor.execute(_SQL_COUNT_HABITS).fetchone()[0]
+
+    def count_tasks(self) -> int:
+        """ Returns the total number of tasks with one COUNT query."""
+        return self.cursor.execute(_SQL_COUNT_TASKS).fetchone()[0]
+
+    def iter_tasks_with_habit(self, row_factory=as_row, batch_size=256,
+                              limit=-1, offset=0):
+        """ Streams all tasks together with the name of their habit.
+
+        A single JOIN replaces the per-task habit lookup, and the rows are
+        yielded in `fetchmany` batches from a dedicated cursor, so arbitrarily
+        long task lists are walked in constant memory and the first row is
+        available before the last one is computed.
+
+        Args:
+            row_factory (function, optional): The function to use as the row factory.
+            Defaults to `as_row`.
+            batch_size (int, optional): How many rows to fetch per batch.
+            Defaults to 256.
+            limit (int, optional): Maximum number of rows to yield;
+            -1 yields all. Defaults to -1.
+            offset (int, optional): Number of rows to skip. Defaults to 0.
+
+        Yields:
+            Rows with the habit name and the task's id_task, task and
+            completed columns, ordered by habit name."""
+
+        cursor = self.connection.cursor()
+        cursor.row_factory = row_factory
+        cursor.execute(_SQL_TASKS_WITH_HABIT, [limit, offset])
+        while rows := cursor.fetchmany(batch_size):
+            yield from rows
+
+    def select_tasks_with_habit(self, row_factory=as_row):
+        """ Returns all tasks together with the name of their habit.
+
+        Thin materializing wrapper around `iter_tasks_with_habit` for callers
+        that need the full list.
+
+        Args:
+            row_factory (function, optional): The function to use as the row factory.
+            Defaults to `as_row`.
+
+        Returns:
+            list: A list of rows with the habit name and the task's
+            id_task, task and completed columns, ordered by habit name."""
+
+        return list(self.iter_tasks_with_habit(row_factory))
+
+    def update_completed(self, id_tasks):
+        """ Marks the given tasks as completed in a single transaction.
+
+        Args:
+            id_tasks (iterable): The IDs of the tasks to mark as completed.
+
+        Batching all updates into one statement means the session pays for a
+        single commit instead of one per confirmed task, and the timestamp
+        is computed once in Python rather than through a datetime() call
+        per row."""
+
+        stamp = datetime.now().strftime(DATE_FORMAT)
+        with self.transaction():
+            self.cursor.executemany(
+                _SQL_UPDATE_COMPLETED,
+                [(stamp, id_task) for id_task in id_tasks])
+
+    def report_same_period(self, periodicity: str, row_factory=as_row):
         """
             Report that returns a list of all habits with the same periodicity.
 
@@ -145,20 +571,48 @@ class DB:
                     A function that specifies how the rows returned by the database query
                     should be represented.
 
-                    The default value is `as_dictionary`, which returns
-                    the rows as dictionaries where the keys are the column names and the values
-                    are the column values.
+                    The default value is `as_row` (`sqlite3.Row`), whose rows
+                    support access by index and by column name without building
+                    a dictionary per row.
 
             Returns:
-                list: A list of dictionaries, where each dictionary represents a row and
-                the keys are the column names and the values are the column values. """
+                list: A list of rows produced by the active row factory,
+                addressable by column name. """
         self._set_row_factory(row_factory)
         query = self.cursor.execute(
-            '''SELECT periodicity, name FROM habits where periodicity = ?;''',
-            [Periodicity[periodicity.upper()].value])
+            _SQL_SAME_PERIOD,
+            [_PERIOD_LOOKUP[periodicity.lower()]])
         return query.fetchall()
 
-    def report_longest_streak(self, row_factory=as_dictionary):
+    def report_streak_stats(self, id_habit: int = None, row_factory=as_row):
+        """
+            Returns the longest, shortest and per-habit longest streak at once.
+
+            The longest/shortest/given-habit reports each used to cost their
+            own scan of the reports table; this aggregates all three numbers
+            in a single pass. The name-bearing single-value reports below stay
+            for the interactive views, which show the habit the streak
+            belongs to.
+
+            Args:
+                id_habit (int, optional): The habit whose personal best should
+                    be included as `longest_for_habit`. Defaults to None.
+                row_factory (function, optional):
+                    A function that specifies how the rows returned by the database query
+                    should be represented.
+
+                    The default value is `as_row` (`sqlite3.Row`), whose rows
+                    support access by index and by column name without building
+                    a dictionary per row.
+
+            Returns:
+                A single row with the columns `longest_all`, `shortest_all`
+                and `longest_for_habit` (None when no id_habit was given)."""
+        self._set_row_factory(row_factory)
+        query = self.cursor.execute(_SQL_STREAK_STATS, [id_habit])
+        return query.fetchone()
+
+    def report_longest_streak(self, row_factory=as_row):
         """
             Returns the longest run streak of all defined habits.
 
@@ -167,19 +621,18 @@ class DB:
                     A function that specifies how the rows returned by the database query
                     should be represented.
 
-                    The default value is `as_dictionary`, which returns
-                    the rows as dictionaries where the keys are the column names and the values
-                    are the column values.
+                    The default value is `as_row` (`sqlite3.Row`), whose rows
+                    support access by index and by column name without building
+                    a dictionary per row.
 
             Returns:
-                list: A list of dictionaries, where each dictionary represents a row
-                and the keys are the column names and the values are the column values."""
+                list: A list of rows produced by the active row factory,
+                addressable by column name."""
         self._set_row_factory(row_factory)
-        query = self.cursor.execute('''
-                SELECT name, MAX(current_streak) as "Highest Streak" FROM reports;''')
+        query = self.cursor.execute(_SQL_LONGEST_STREAK)
         return query.fetchall()
 
-    def report_shortest_streak(self, row_factory=as_dictionary):
+    def report_shortest_streak(self, row_factory=as_row):
         """
            Return the shortest run streak of all defined habits.
 
@@ -188,20 +641,18 @@ class DB:
                     A function that specifies how the rows returned by the database query
                     should be represented.
 
-                    The default value is `as_dictionary`, which returns
-                    the rows as dictionaries where the keys are the column names and the values
-                    are the column values.
+                    The default value is `as_row` (`sqlite3.Row`), whose rows
+                    support access by index and by column name without building
+                    a dictionary per row.
 
            Returns:
-               list: A list of dictionaries, where each dictionary represents a row
-               and the keys are the column names and the values are the column values."""
+               list: A list of rows produced by the active row factory,
+                addressable by column name."""
         self._set_row_factory(row_factory)
-        query = self.cursor.execute('''
-                SELECT name, MIN(current_streak) as "Highest Streak" FROM reports WHERE 
-                current_streak > 0;''')
+        query = self.cursor.execute(_SQL_SHORTEST_STREAK)
         return query.fetchall()
 
-    def report_longest_streak_given_habit(self, id_habit: int, row_factory=as_dictionary):
+    def report_longest_streak_given_habit(self, id_habit: int, row_factory=as_row):
         """
         Returns the longest run streak for a given habit.
 
@@ -211,21 +662,19 @@ class DB:
                 A function that specifies how the rows returned by the database query
                 should be represented.
 
-                The default value is `as_dictionary`, which returns
-                the rows as dictionaries where the keys are the column names and the values
-                are the column values.
+                The default value is `as_row` (`sqlite3.Row`), whose rows
+                support access by index and by column name without building
+                a dictionary per row.
 
         Returns:
-            list: A list of dictionaries, where each dictionary represents a row
-            and the keys are the column names and the values are the column values."""
+            list: A list of rows produced by the active row factory,
+                addressable by column name."""
 
         self._set_row_factory(row_factory)
-        query = self.cursor.execute('''
-                SELECT name, MAX(current_streak) as "Highest Streak" 
-                FROM reports where id_habit = ?;''', [id_habit])
+        query = self.cursor.execute(_SQL_LONGEST_STREAK_GIVEN_HABIT, [id_habit])
         return query.fetchall()
 
-    def get_habit_list_snapshot(self, row_factory=as_dictionary):
+    def get_habit_list_snapshot(self, row_factory=as_row):
         """
         Return a snapshot of habit list.
 
@@ -234,15 +683,13 @@ class DB:
                     A function that specifies how the rows returned by the database query
                     should be represented.
 
-                    The default value is `as_dictionary`, which returns
-                    the rows as dictionaries where the keys are the column names and the values
-                    are the column values.
+                    The default value is `as_row` (`sqlite3.Row`), whose rows
+                    support access by index and by column name without building
+                    a dictionary per row.
 
             Returns:
-                list: A list of dictionaries, where each dictionary represents a row
-                and the keys are the column names and the values are the column values."""
+                list: A list of rows produced by the active row factory,
+                addressable by column name."""
         self._set_row_factory(row_factory)
-        query = self.cursor.execute('''
-            select id_habit, name  from reports r group by id_habit;
-        ''')
+        query = self.cursor.execute(_SQL_HABIT_LIST_SNAPSHOT)
         return query.fetchall()
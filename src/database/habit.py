@@ -1,13 +1,40 @@
-import json
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Generator, Self
 
-from .db import DB, DATE_FORMAT
+from .db import (DB, DATE_FORMAT, as_row, format_timestamp, get_db,
+                 parse_timestamp)
+from .serialization import dumps, loads
 from .types import Periodicity
 
-
-@dataclass
+# Enum construction (Periodicity(value)) walks the member list on every
+# call; a plain dict lookup resolves the member in one hash probe, which
+# adds up when mapping thousands of habit rows.
+_PERIODICITY_CACHE = {p.value: p for p in Periodicity}
+
+# Module-level SQL keeps the statement text byte-identical between calls,
+# so sqlite3's per-connection statement cache serves the compiled query.
+_SQL_HABIT_GET = 'SELECT * FROM habits WHERE id_habit = ?'
+# The CASE form avoids the implicit bool-to-int coercion per row, and the
+# whole summary is answered from the idx_tasks_habit_completed covering
+# index without touching the table.
+_SQL_HABIT_TASK_SUMMARY = (
+    'SELECT COUNT(*) as tasks, '
+    'SUM(CASE WHEN completed THEN 1 ELSE 0 END) as tasks_completed '
+    'FROM tasks WHERE id_habit = ?')
+_SQL_HABIT_UPDATE = ('UPDATE habits SET name=?, periodicity=?, template=?, '
+                     'id_habit=?, streak=?, created_at=?, updated_at=? '
+                     'WHERE id_habit=?')
+_SQL_HABIT_INSERT = ('REPLACE INTO habits (name, periodicity, template, '
+                     'id_habit, streak, created_at, updated_at) '
+                     'VALUES(?, ?, ?, ?, ?, ?, ?)')
+_SQL_HABIT_DELETE = 'DELETE FROM habits WHERE id_habit = ?'
+_SQL_HABIT_BULK_INSERT = ('INSERT INTO habits (name, periodicity, template, '
+                          'streak, created_at, updated_at) '
+                          'VALUES(?, ?, ?, ?, ?, ?)')
+
+
+@dataclass(slots=True)
 class Habit:
     """
     Represents a habit with associated properties.
@@ -23,7 +50,7 @@ class Habit:
         Defaults to the current datetime.
         id_habit (int, optional): The unique ID of the habit. Defaults to None.
         db (DB, optional): The database instance associated with the habit.
-        Defaults to a new DB instance.
+        Defaults to the shared connection from get_db().
 
     Note:
         - The `periodicity` attribute should be an instance of the `Periodicity` class.
@@ -36,18 +63,19 @@ class Habit:
     periodicity: Periodicity
     template: list[str]
     streak: int = 0
-    created_at: datetime = datetime.now()
-    updated_at: datetime = datetime.now()
+    # default_factory: evaluated per instance, not once at class creation.
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
     id_habit: int = None
-    db: DB = DB()
+    db: DB = field(default_factory=get_db)
 
     @staticmethod
     def objects(
             no_tasks=False,
             filter_habit=None,
             finished=False,
-            timestamp=datetime.now(),
-            db: DB = DB()
+            timestamp=None,
+            db: DB = None
     ) -> Generator:
         """
         Retrieve habits from the database.
@@ -58,7 +86,7 @@ class Habit:
         Args:
             no_tasks (bool, optional): If True, filter habits with no associated tasks.
                 Defaults to False.
-            db (DB, optional): Database connection object. Defaults to DB().
+            db (DB, optional): Database connection object. Defaults to the shared connection from get_db().
             filter_habit: Defined query filter.
             finished: selects finished habits, regardless of state.
             timestamp: datetime=datetime.now(): internal override for test data generation
@@ -72,41 +100,154 @@ class Habit:
         Returns:
             Generator: A generator yielding instances of Habit.
         """
+        db = db or get_db()
+        where, params = Habit._build_filter(no_tasks, filter_habit,
+                                            finished, timestamp)
+        # A dedicated cursor lets rows stream out one at a time without being
+        # clobbered by queries the consumer runs while iterating.
+        cursor = db.connection.cursor()
+        cursor.row_factory = as_row
+        for row in cursor.execute(f'SELECT * FROM habits h {where}', params):
+            yield Habit._map_db(row, db=db)
+
+    @staticmethod
+    def _build_filter(no_tasks=False, filter_habit=None, finished=False,
+                      timestamp=None):
+        """
+        Build the WHERE clause and parameter list shared by objects/count.
+
+        Filters are bound as parameters rather than interpolated into the
+        SQL text, so the statement stays byte-identical across calls and
+        sqlite3's statement cache can reuse the compiled query.
+
+        Returns:
+            tuple: The WHERE clause text (may be empty) and its parameters.
+        """
+        timestamp = timestamp or datetime.now()
         q_filter = []
+        params = []
         if no_tasks:
-            q_filter.append('(select count(*) from tasks '
-                            'where id_habit = h.id_habit) = 0')
+            # NOT EXISTS stops at the first matching task instead of
+            # counting them all.
+            q_filter.append('NOT EXISTS (SELECT 1 FROM tasks '
+                            'WHERE id_habit = h.id_habit)')
 
         if filter_habit:
-            q_filter.append(f'id_habit = {filter_habit.id_habit}')
+            q_filter.append('id_habit = ?')
+            params.append(filter_habit.id_habit)
 
         if finished:
-            past_day = timestamp - timedelta(days=1)
-            past_week = timestamp - timedelta(days=7)
-            past_month = timestamp - timedelta(days=30)
-            q_filter.append(f'''
+            # The period cutoffs are derived in SQL from one bound "now"
+            # value, so Python does a single timestamp render per call
+            # instead of three timedelta subtractions plus strftimes.
+            q_filter.append('''
             (
-                (updated_at <= '{past_day.strftime(DATE_FORMAT)}'
-                    and periodicity = '{Periodicity.DAILY}')
+                (updated_at <= datetime(?, '-1 days') and periodicity = ?)
                 or
-                (updated_at <= '{past_week.strftime(DATE_FORMAT)}'
-                    and periodicity = '{Periodicity.WEEKLY}')
+                (updated_at <= datetime(?, '-7 days') and periodicity = ?)
                 or
-                (updated_at <= '{past_month.strftime(DATE_FORMAT)}'
-                    and periodicity = '{Periodicity.MONTHLY}')
+                (updated_at <= datetime(?, '-30 days') and periodicity = ?)
                 or
-                (select count(*) from tasks 
-                where completed is not TRUE and id_habit = h.id_habit) = 0 
+                NOT EXISTS (SELECT 1 FROM tasks
+                WHERE id_habit = h.id_habit AND completed = 0)
             )
             ''')
+            stamp = format_timestamp(timestamp)
+            params += [
+                stamp, Periodicity.DAILY.value,
+                stamp, Periodicity.WEEKLY.value,
+                stamp, Periodicity.MONTHLY.value,
+            ]
 
         where = f'where {" and ".join(q_filter)}' if len(q_filter) > 0 else ''
-        query = db.cursor.execute(f'SELECT * FROM habits h {where}')
+        return where, params
+
+    @staticmethod
+    def count(
+            no_tasks=False,
+            filter_habit=None,
+            finished=False,
+            timestamp=None,
+            db: DB = None
+    ) -> int:
+        """
+        Count habits matching the same filters objects() accepts.
+
+        Counting in SQL returns one integer instead of deserializing every
+        matching row into a Habit just to take len() of a list.
+
+        Args:
+            no_tasks (bool, optional): If True, count habits with no
+                associated tasks. Defaults to False.
+            filter_habit: Defined query filter.
+            finished: counts finished habits, regardless of state.
+            timestamp: datetime=datetime.now(): internal override for test data generation
+            db (DB, optional): Database connection object. Defaults to the shared connection from get_db().
+
+        Returns:
+            int: The number of matching habits.
+        """
+        db = db or get_db()
+        where, params = Habit._build_filter(no_tasks, filter_habit,
+                                            finished, timestamp)
+        query = db.cursor.execute(
+            f'SELECT COUNT(*) FROM habits h {where}', params)
+        return query.fetchone()[0]
+
+    @staticmethod
+    def objects_needing_sync(timestamp=None, db: DB = None) -> Generator:
+        """
+        Retrieve all habits together with their sync flags in one scan.
+
+        `sync_tasks` used to run two separate table scans, one for finished
+        habits and one for habits without tasks. This method joins the tasks
+        in once and derives both predicates from the grouped counts, so the
+        tasks table is read a single time instead of twice per habit via
+        correlated subqueries.
+
+        Args:
+            timestamp (datetime, optional): Override of "now" for the overdue
+                checks. Defaults to the current datetime.
+            db (DB, optional): Database connection object. Defaults to the shared connection from get_db().
+
+        Yields:
+            Generator: Tuples of (Habit, finished, needs_tasks) where
+            `finished` flags habits whose period is over or whose tasks are
+            all completed, and `needs_tasks` flags habits without any tasks.
+        """
+        timestamp = timestamp or datetime.now()
+        db = db or get_db()
+        cursor = db.connection.cursor()
+        cursor.row_factory = as_row
+        stamp = format_timestamp(timestamp)
+        query = cursor.execute('''
+            SELECT h.*,
+                (
+                    (h.updated_at <= datetime(?, '-1 days')
+                        and h.periodicity = ?)
+                    or (h.updated_at <= datetime(?, '-7 days')
+                        and h.periodicity = ?)
+                    or (h.updated_at <= datetime(?, '-30 days')
+                        and h.periodicity = ?)
+                    or SUM(CASE WHEN t.id_task IS NOT NULL and t.completed is not TRUE
+                        THEN 1 ELSE 0 END) = 0
+                ) as finished,
+                COUNT(t.id_task) = 0 as needs_tasks
+            FROM habits h LEFT JOIN tasks t ON t.id_habit = h.id_habit
+            GROUP BY h.id_habit''', [
+            stamp, Periodicity.DAILY.value,
+            stamp, Periodicity.WEEKLY.value,
+            stamp, Periodicity.MONTHLY.value,
+        ])
+        # Materialized on purpose: consumers update the habits table while
+        # iterating, which must not affect the snapshot of sync flags.
         for row in query.fetchall():
-            yield Habit._map_db(row, db=db)
+            yield (Habit._map_db(row, db=db),
+                   bool(row['finished']),
+                   bool(row['needs_tasks']))
 
     @staticmethod
-    def _map_db(row, db: DB = DB()):
+    def _map_db(row, db: DB = None):
         """
         Maps a database row to a Habit object.
 
@@ -124,34 +265,36 @@ class Habit:
 
         Raises:
             ValueError: If the data in the row is not formatted correctly."""
+        db = db or get_db()
         return Habit(
-            name=row.get('name'),
-            periodicity=Periodicity(row.get('periodicity')),
-            template=row.get('template'),
-            id_habit=row.get('id_habit'),
-            streak=row.get('streak'),
-            created_at=datetime.strptime(row.get('created_at'), DATE_FORMAT),
-            updated_at=datetime.strptime(row.get('updated_at'), DATE_FORMAT),
+            name=row['name'],
+            periodicity=_PERIODICITY_CACHE[row['periodicity']],
+            # The template JSON is decoded here, at the single place a parsed
+            # list is needed, instead of eagerly in the row factory for every
+            # query that happens to select the column.
+            template=loads(row['template']),
+            id_habit=row['id_habit'],
+            streak=row['streak'],
+            created_at=parse_timestamp(row['created_at']),
+            updated_at=parse_timestamp(row['updated_at']),
             db=db,
         )
 
     @staticmethod
-    def get(id_habit: int, db: DB = DB()):
+    def get(id_habit: int, db: DB = None):
         """
             Retrieve a Habit object from the database based on the given habit ID.
 
             Parameters:
             - id_habit (int): The ID of the habit to retrieve.
-            - db (DB, optional): The database connection. Defaults to a new DB instance.
+            - db (DB, optional): The database connection. Defaults to the shared connection from get_db().
 
             Returns:
             Habit or None: A Habit object representing the retrieved habit if found,
             or None if not found."""
 
-        query = db.cursor.execute(
-            '''SELECT * FROM habits where id_habit = ?''',
-            [id_habit]
-        )
+        db = db or get_db()
+        query = db.cursor.execute(_SQL_HABIT_GET, [id_habit])
         row = query.fetchone()
         return Habit._map_db(row, db=db)
 
@@ -176,11 +319,10 @@ class Habit:
             """
 
         select = self.db.cursor.execute(
-            '''SELECT COUNT(*) as tasks, sum(completed) as tasks_completed 
-            from tasks where id_habit = ? ''', [self.id_habit])
+            _SQL_HABIT_TASK_SUMMARY, [self.id_habit])
         summary = select.fetchone()
         return [self.id_habit, self.name, self.periodicity.value, self.streak,
-                summary.get('tasks'), summary.get('tasks_completed')]
+                summary['tasks'], summary['tasks_completed']]
 
     def save(self) -> Self:
         """
@@ -200,7 +342,9 @@ class Habit:
         value_list = [
             self.name,
             self.periodicity.value,
-            json.dumps(self.template),
+            # Compact output: the template is written once and read on
+            # every habit row, so smaller text means fewer pages to scan.
+            dumps(self.template),
             self.id_habit,
             self.streak,
             self.created_at.strftime(DATE_FORMAT),
@@ -208,35 +352,53 @@ class Habit:
         ]
         if self.id_habit is not None:
             value_list.append(self.id_habit)
-            self.db.cursor.execute(
-                '''UPDATE habits SET name=?, periodicity=?, template=?, id_habit=?, streak=?, 
-                created_at=?, updated_at=? 
-                where id_habit=?''', value_list
-            )
+            self.db.cursor.execute(_SQL_HABIT_UPDATE, value_list)
         else:
-            self.db.cursor.execute(
-                '''REPLACE INTO habits 
-                (name, periodicity, template, id_habit, streak, created_at, updated_at) 
-                VALUES(?, ?, ?, ?, ?, ?, ?)''',
-                value_list
-            )
-        self.db.connection.commit()
-
-        query = self.db.cursor.execute(
-            '''SELECT * FROM habits where name = ?''', [self.name])
-        raw_data = query.fetchone()
-        self.id_habit = raw_data.get('id_habit')
+            self.db.cursor.execute(_SQL_HABIT_INSERT, value_list)
+            # The driver hands back the generated key directly; no need to
+            # re-read the row by name after the insert.
+            self.id_habit = self.db.cursor.lastrowid
+        self.db.commit()
         return self
 
+    @staticmethod
+    def bulk_save(habits: list, db: DB = None):
+        """
+        Insert a batch of Habit instances with a single statement and commit.
+
+        Saving habits one by one pays for a commit per row; this method
+        feeds all rows to `executemany` and commits once, mirroring
+        Task.bulk_create. Like there, the generated ids are not written
+        back to the instances.
+
+        Args:
+            habits (list): The Habit instances to insert.
+            db (DB, optional): The database connection to use.
+                Defaults to the shared connection from get_db().
+
+        Returns:
+            None
+        """
+        db = db or get_db()
+        with db.transaction():
+            db.cursor.executemany(
+                _SQL_HABIT_BULK_INSERT,
+                [(habit.name, habit.periodicity.value, dumps(habit.template),
+                  habit.streak,
+                  habit.created_at.strftime(DATE_FORMAT),
+                  habit.updated_at.strftime(DATE_FORMAT))
+                 for habit in habits])
+
     def delete(self) -> Self:
         """
         Deletes the current instance from the database.
 
-        This method deletes the instance's data from the associated database tables
-        ('tasks' and 'habits') based on the 'id_habit' value. It raises a ReferenceError
-        if the instance has not been saved (i.e., 'id_habit' is None). After successful
-        deletion, the database changes are committed, and the method returns the updated
-        instance.
+        This method deletes the instance's data from the 'habits' table based on
+        the 'id_habit' value; the habit's tasks go with it through the ON DELETE
+        CASCADE on their foreign key, so one statement covers both tables. It
+        raises a ReferenceError if the instance has not been saved (i.e.,
+        'id_habit' is None). After successful deletion, the database changes are
+        committed, and the method returns the updated instance.
 
         Returns:
             Self: The updated instance after deletion.
@@ -246,13 +408,6 @@ class Habit:
         if self.id_habit is None:
             raise ReferenceError(
                 'This instance has not been saved yet so you cannot delete it!')
-        self.db.cursor.execute(
-            '''DELETE FROM tasks WHERE id_habit = ?''',
-            [self.id_habit]
-        )
-        self.db.cursor.execute(
-            '''DELETE FROM habits WHERE id_habit = ?''',
-            [self.id_habit]
-        )
-        self.db.connection.commit()
+        self.db.cursor.execute(_SQL_HABIT_DELETE, [self.id_habit])
+        self.db.commit()
         return self
@@ -1,14 +1,26 @@
-import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Generator
 
-from .db import DB, DATE_FORMAT
+from .db import DB, DATE_FORMAT, as_row, get_db, parse_timestamp
 from .habit import Habit
-from .task import Task
-
-
-@dataclass
+from .serialization import dumps
+
+# Module-level SQL keeps the statement text byte-identical between calls,
+# so sqlite3's per-connection statement cache serves the compiled query.
+_SQL_REPORT_ALL = 'SELECT * FROM reports'
+_SQL_REPORT_INSERT = ('INSERT INTO reports (id_habit, name, current_streak, '
+                      'completed_tasks_count, uncompleted_tasks_count, '
+                      'raw_data, id_report, created_at) '
+                      'VALUES (?, ?, ?, ?, ?, ?, ?, ?)')
+_SQL_REPORT_DELETE = 'DELETE FROM reports WHERE id_report = ?'
+# Column order matches the historical to_json() key order, so the raw_data
+# snapshots keep their shape while being built straight from the rows.
+_SQL_TASK_SNAPSHOT = ('SELECT id_habit, task, completed, id_task, '
+                      'created_at, updated_at FROM tasks WHERE id_habit = ?')
+
+
+@dataclass(slots=True)
 class Report:
     """
     A class representing a report containing information about habits and tasks.
@@ -24,7 +36,7 @@ class Report:
           is the current datetime).
         raw_data (dict, optional): Raw data associated with the report (default is None).
         db (DB, optional): An instance of the DB class for database operations (default
-          is an instance of DB).
+          is the shared connection from get_db()).
 
     Note:
         The `DB` class should be imported and provided to the `db`
@@ -36,37 +48,49 @@ class Report:
     current_streak: int = None
     completed_tasks_count: int = None
     uncompleted_tasks_count: int = None
-    created_at: datetime = datetime.now()
+    # default_factory: evaluated per instance, not once at class creation.
+    created_at: datetime = field(default_factory=datetime.now)
     raw_data: dict = None
-    db: DB = DB()
+    db: DB = field(default_factory=get_db)
 
     @staticmethod
-    def _map_report(row, db: DB = DB()):
+    def _map_report(row, db: DB = None):
+        db = db or get_db()
         return Report(
-            id_report=row.get('id_report'),
-            id_habit=row.get('id_habit'),
-            name=row.get('name'),
-            current_streak=row.get('current_streak'),
-            completed_tasks_count=row.get('completed_tasks_count'),
-            uncompleted_tasks_count=row.get('uncompleted_tasks_count'),
-            created_at=datetime.strptime(row.get('created_at'), DATE_FORMAT),
+            id_report=row['id_report'],
+            id_habit=row['id_habit'],
+            name=row['name'],
+            current_streak=row['current_streak'],
+            completed_tasks_count=row['completed_tasks_count'],
+            uncompleted_tasks_count=row['uncompleted_tasks_count'],
+            created_at=parse_timestamp(row['created_at']),
             db=db
         )
 
     @staticmethod
-    def objects(db: DB = DB()) -> Generator:
-        query = db.cursor.execute('SELECT * FROM reports')
-        for row in query.fetchall():
+    def objects(db: DB = None) -> Generator:
+        db = db or get_db()
+        # A dedicated cursor lets rows stream out one at a time without being
+        # clobbered by queries the consumer runs while iterating.
+        cursor = db.connection.cursor()
+        cursor.row_factory = as_row
+        for row in cursor.execute(_SQL_REPORT_ALL):
             yield Report._map_report(row, db=db)
 
-    def save(self):
+    def save(self, habit: Habit = None):
         """
         Saves the current state of the habit report into the database.
 
         This method computes statistics about the associated Habit and its Task objects,
         and inserts a new entry into the 'reports' table in the database to store the
         report data. It also updates the `id_report` attribute of the instance based on
-        the newly generated report.
+        the newly generated report. The task counts land in
+        `completed_tasks_count`/`uncompleted_tasks_count` on the instance so
+        callers like `generate` can reuse them without a second query.
+
+        Args:
+            habit (Habit, optional): The habit the report describes. Fetched
+                from the database when not supplied.
 
         Returns:
             int: The ID of the generated report.
@@ -75,42 +99,38 @@ class Report:
             DatabaseError: If there's an issue with the database operations.
 
         Note:
-            This method assumes that the `Habit` and `Task` classes are properly defined
-            and that the database connection and cursor are available through `self.db`.
+            The task snapshot is read as raw rows: the stored timestamps are
+            already DATE_FORMAT text, so serializing the rows directly skips
+            building a Task instance (two datetime parses plus two renders)
+            per task just to throw it away after the dump.
 
         """
-        habit = Habit.get(self.id_habit, db=self.db)
-        task_list = list(Task.objects(habit, db=self.db))
+        habit = habit or Habit.get(self.id_habit, db=self.db)
+        cursor = self.db.connection.cursor()
+        cursor.row_factory = as_row
+        rows = cursor.execute(_SQL_TASK_SNAPSHOT, [self.id_habit]).fetchall()
 
-        uncompleted_tasks_count = len(task_list)
-        completed_tasks_count = 0
-        for task in task_list:
-            uncompleted_tasks_count -= 1 if task.completed else 0
-            completed_tasks_count += 1 if task.completed else 0
+        # One pass over the rows; the uncompleted count is just the
+        # complement, no second conditional per row needed.
+        self.completed_tasks_count = sum(1 for row in rows if row['completed'])
+        self.uncompleted_tasks_count = len(rows) - self.completed_tasks_count
+        self.raw_data = dumps([dict(row) for row in rows])
 
         self.db.cursor.execute(
-            '''INSERT INTO reports (id_habit, name, current_streak, completed_tasks_count, 
-                        uncompleted_tasks_count, raw_data, id_report, created_at) VALUES (?, ?, ?, 
-                        ?, ?, ?, ? , ?)''',
+            _SQL_REPORT_INSERT,
             (
                 habit.id_habit,
                 habit.name,
                 habit.streak,
-                completed_tasks_count,
-                uncompleted_tasks_count,
-                json.dumps([task.to_json() for task in task_list]),
+                self.completed_tasks_count,
+                self.uncompleted_tasks_count,
+                self.raw_data,
                 self.id_report,
                 self.created_at.strftime(DATE_FORMAT)
             ),
         )
-        self.db.connection.commit()
-        query = self.db.cursor.execute(
-            '''SELECT * FROM reports 
-            where id_habit = ? 
-            and created_at = (select MAX(created_at) from reports)''',
-            [self.id_habit])
-        raw_data = query.fetchone()
-        self.id_report = raw_data.get('id_report')
+        self.id_report = self.db.cursor.lastrowid
+        self.db.commit()
         return self
 
     def generate(self):
@@ -125,40 +145,51 @@ class Report:
           1. Save the current state of the habit.
           2. Retrieve the habit from the database using the provided habit ID.
           3. Retrieve a list of tasks associated with the habit.
-          4. Delete all tasks associated with the habit.
-          5. Calculate the number of completed tasks.
-          6. Update the habit's streak based on completed tasks.
-          7. Save the updated habit to the database.
+          4. Reset the habit's tasks to uncompleted for the new period.
+          5. Update the habit's streak based on the uncompleted task count.
 
         Note:
 
         - The habit's streak is incremented if all tasks are completed, otherwise, it's reset to 0.
+          The decision is made in SQL via a CASE expression, so no separate
+          habit write is needed.
+        - The tasks are reset in place rather than deleted and re-created
+          from the template: the report's raw_data already snapshots the
+          finished period, and keeping the rows avoids delete/insert churn
+          and unbounded task IDs.
+        - The whole workflow runs inside one transaction, so the report row,
+          task reset and streak update land with a single commit.
         - This method assumes the existence of the Habit and Task classes, and
         a database connection.
 
         Returns:
             None
         """
-        self.save()
-
-        habit = Habit.get(self.id_habit, db=self.db)
-        task_list = list(Task.objects(habit, db=self.db))
-        for task in task_list:
-            task.delete()
-
-        done_tasks = 0
-        for task in task_list:
-            done_tasks += 1 if task.completed else 0
-        habit.streak = habit.streak + 1 if done_tasks == len(task_list) else 0
-        habit.save()
+        with self.db.transaction():
+            habit = Habit.get(self.id_habit, db=self.db)
+            # save() counts the tasks while snapshotting them, so the streak
+            # decision below reuses its uncompleted count directly.
+            self.save(habit=habit)
+
+            # One Python-side timestamp shared by both updates, instead of
+            # a datetime() function call inside each statement.
+            stamp = datetime.now().strftime(DATE_FORMAT)
+            self.db.cursor.execute(
+                '''UPDATE tasks SET completed = FALSE,
+                updated_at = ?
+                WHERE id_habit = ?''', [stamp, self.id_habit])
+
+            self.db.cursor.execute(
+                '''UPDATE habits
+                SET streak = CASE WHEN ? = 0 THEN streak + 1 ELSE 0 END,
+                    updated_at = ?
+                WHERE id_habit = ?''',
+                [self.uncompleted_tasks_count, stamp, self.id_habit])
 
     def delete(self):
         if self.id_report is None:
             raise ReferenceError(
                 'This instance has not been saved yet so you cannot delete it!')
-        self.db.cursor.execute(
-            '''DELETE FROM reports WHERE id_report = ?''',
-            [self.id_report]
-        )
-        self.db.connection.commit()
+        self.db.cursor.execute(_SQL_REPORT_DELETE, [self.id_report])
+        self.db.commit()
         return self
@@ -0,0 +1,31 @@
+"""
+JSON serialization helpers for the database module.
+
+If orjson is installed its C implementation is used, which is several times
+faster than the standard library for the report raw_data payloads (one dict
+per task, potentially hundreds per report). Without it the helpers fall back
+to the standard library with compact separators, so orjson stays an optional
+speed-up rather than a hard dependency.
+"""
+
+try:
+    import orjson
+
+    def dumps(data) -> str:
+        """ Serializes data to a JSON string."""
+        return orjson.dumps(data).decode()
+
+    def loads(data):
+        """ Deserializes a JSON string or bytes."""
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    def dumps(data) -> str:
+        """ Serializes data to a JSON string."""
+        return json.dumps(data, separators=(',', ':'))
+
+    def loads(data):
+        """ Deserializes a JSON string or bytes."""
+        return json.loads(data)
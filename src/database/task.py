@@ -1,12 +1,26 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Generator, Self
 
-from .db import DB, DATE_FORMAT
+from .db import DB, as_row, format_timestamp, get_db, parse_timestamp
 from .habit import Habit
 
-
-@dataclass
+# Module-level SQL keeps the statement text byte-identical between calls,
+# so sqlite3's per-connection statement cache serves the compiled query.
+_SQL_TASK_ALL = 'SELECT * FROM tasks'
+_SQL_TASK_BY_HABIT = 'SELECT * FROM tasks WHERE id_habit = ?'
+_SQL_TASK_GET = 'SELECT * FROM tasks WHERE id_task = ?'
+_SQL_TASK_REPLACE = ('REPLACE INTO tasks (id_habit, task, completed, '
+                     'id_task, created_at, updated_at) '
+                     'VALUES(?, ?, ?, ?, ?, ?)')
+_SQL_TASK_BULK_INSERT = ('INSERT INTO tasks (id_habit, task, completed, '
+                         'created_at, updated_at) VALUES(?, ?, ?, ?, ?)')
+_SQL_TASK_DELETE = 'DELETE FROM tasks WHERE id_task = ?'
+_SQL_TASK_COUNT_ALL = 'SELECT COUNT(*) FROM tasks'
+_SQL_TASK_COUNT_BY_HABIT = 'SELECT COUNT(*) FROM tasks WHERE id_habit = ?'
+
+
+@dataclass(slots=True)
 class Task:
     """
         Represents a task associated with a habit.
@@ -20,13 +34,13 @@ class Task:
                 (default is the current datetime).
             updated_at (datetime, optional): The timestamp of task last update
                 (default is the current datetime).
-            db (DB, optional): The database connection instance (default is a new instance of DB()).
+            db (DB, optional): The database connection instance (default is the shared connection from get_db()).
 
         Methods:
             habit(self) -> Habit:
                 Retrieves the associated Habit object for this task.
 
-            objects(habit: Habit = None, db: DB = DB()) -> Generator:
+            objects(habit: Habit = None, db: DB = None) -> Generator:
                 Generator that yields Task instances filtered by habit.
 
             _map_task(row) -> Generator:
@@ -35,19 +49,20 @@ class Task:
             save(self) -> Self:
                 Saves the task instance to the database.
 
-            from_habit(habit: Habit, db: DB = DB()):
+            from_habit(habit: Habit, db: DB = None):
                 Creates and saves tasks based on a Habit's template.
 
-            get(id_task: int, db: DB = DB()) -> Task:
+            get(id_task: int, db: DB = None) -> Task:
                 Retrieves a Task instance based on its ID."""
 
     id_habit: int
     task: str
     completed: bool = False
     id_task: int = None
-    created_at: datetime = datetime.now()
-    updated_at: datetime = datetime.now()
-    db: DB = DB()
+    # default_factory: evaluated per instance, not once at class creation.
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    db: DB = field(default_factory=get_db)
 
     def habit(self) -> Habit:
         """
@@ -67,7 +82,7 @@ class Task:
         return Habit.get(id_habit=self.id_habit, db=self.db)
 
     @staticmethod
-    def objects(habit: Habit = None, db: DB = DB()) -> Generator:
+    def objects(habit: Habit = None, db: DB = None) -> Generator:
         """
         Retrieve tasks from the database based on the provided habit or retrieve
         all tasks if no habit is provided.
@@ -75,23 +90,49 @@ class Task:
         Args:
             habit (Habit, optional): The habit for which to retrieve tasks.
                 If not provided, all tasks will be retrieved.
-            db (DB, optional): The database connection to use. Defaults to a new DB instance.
+            db (DB, optional): The database connection to use. Defaults to the shared connection from get_db().
 
         Yields:
             Generator: A generator that yields mapped Task instances retrieved from the database."""
 
+        db = db or get_db()
+        # A dedicated cursor lets rows stream out one at a time without being
+        # clobbered by queries the consumer runs while iterating.
+        cursor = db.connection.cursor()
+        cursor.row_factory = as_row
         if isinstance(habit, Habit):
-            query = db.cursor.execute(
-                'SELECT * FROM tasks where id_habit = ?',
-                [habit.id_habit]
-            )
+            query = cursor.execute(_SQL_TASK_BY_HABIT, [habit.id_habit])
         else:
-            query = db.cursor.execute('SELECT * FROM tasks')
-        for row in query.fetchall():
+            query = cursor.execute(_SQL_TASK_ALL)
+        for row in query:
             yield Task._map_task(row, db=db)
 
     @staticmethod
-    def _map_task(row, db: DB = DB()):
+    def count(habit: Habit = None, db: DB = None) -> int:
+        """
+        Count tasks, optionally restricted to one habit.
+
+        Counting in SQL returns one integer instead of deserializing every
+        matching row into a Task just to take len() of a list.
+
+        Args:
+            habit (Habit, optional): The habit whose tasks are counted.
+                If not provided, all tasks are counted.
+            db (DB, optional): The database connection to use. Defaults to the shared connection from get_db().
+
+        Returns:
+            int: The number of matching tasks.
+        """
+        db = db or get_db()
+        if isinstance(habit, Habit):
+            query = db.cursor.execute(_SQL_TASK_COUNT_BY_HABIT,
+                                      [habit.id_habit])
+        else:
+            query = db.cursor.execute(_SQL_TASK_COUNT_ALL)
+        return query.fetchone()[0]
+
+    @staticmethod
+    def _map_task(row, db: DB = None):
         """
             Maps a row from a data source to a Task object.
 
@@ -111,13 +152,14 @@ class Task:
             Returns:
                 Generator[Task, None, None]: A generator yielding a Task object."""
 
+        db = db or get_db()
         return Task(
-            id_task=row.get('id_task'),
-            id_habit=row.get('id_habit'),
-            task=row.get('task'),
-            completed=row.get('completed'),
-            created_at=datetime.strptime(row.get('created_at'), DATE_FORMAT),
-            updated_at=datetime.strptime(row.get('updated_at'), DATE_FORMAT),
+            id_task=row['id_task'],
+            id_habit=row['id_habit'],
+            task=row['task'],
+            completed=row['completed'],
+            created_at=parse_timestamp(row['created_at']),
+            updated_at=parse_timestamp(row['updated_at']),
             db=db
         )
 
@@ -152,22 +194,43 @@ class Task:
         """
 
         self.db.cursor.execute(
-            '''REPLACE INTO tasks 
-            (id_habit, task, completed, id_task, created_at, updated_at) 
-            VALUES(?, ?, ?, ?, ?, ?)''',
+            _SQL_TASK_REPLACE,
             (self.id_habit, self.task, self.completed, self.id_task,
-             self.created_at.strftime(DATE_FORMAT),
-             self.updated_at.strftime(DATE_FORMAT)))
-        self.db.connection.commit()
-        query = self.db.cursor.execute(
-            '''SELECT * FROM tasks where id_habit = ? and task = ?;''',
-            [self.id_habit, self.task])
-        raw_data = query.fetchone()
-        self.id_task = raw_data.get('id_task')
+             format_timestamp(self.created_at),
+             format_timestamp(self.updated_at)))
+        # lastrowid covers both branches: the generated key on a fresh
+        # insert, the explicit one when an existing row was replaced.
+        self.id_task = self.db.cursor.lastrowid
+        self.db.commit()
         return self
 
     @staticmethod
-    def from_habit(habit: Habit, db: DB = DB()):
+    def bulk_create(tasks: list, db: DB = None):
+        """
+        Insert a batch of Task instances with a single statement and commit.
+
+        Saving tasks one by one pays for a commit per row; this method feeds
+        all rows to `executemany` and commits once, which is the dominant win
+        when generating many tasks at a time.
+
+        Args:
+            tasks (list): The Task instances to insert.
+            db (DB, optional): The database connection to use.
+                Defaults to the shared connection from get_db().
+
+        Returns:
+            None
+        """
+        db = db or get_db()
+        with db.transaction():
+            db.cursor.executemany(
+                _SQL_TASK_BULK_INSERT,
+                [(task.id_habit, task.task, task.completed,
+                  format_timestamp(task.created_at),
+                  format_timestamp(task.updated_at)) for task in tasks])
+
+    @staticmethod
+    def from_habit(habit: Habit, db: DB = None):
         """
         Create and save Task instances based on the tasks defined in a Habit's template.
 
@@ -191,27 +254,27 @@ class Task:
         Note:
         Make sure to have the appropriate Task and Habit classes defined before using this method.
         """
-        for task in habit.template:
-            Task(habit.id_habit, task, db=db).save()
+        db = db or get_db()
+        Task.bulk_create(
+            [Task(habit.id_habit, task, db=db) for task in habit.template],
+            db=db)
 
     @staticmethod
-    def get(id_task: int, db: DB = DB()):
+    def get(id_task: int, db: DB = None):
         """
         Retrieve a task from the database by its ID.
 
         Args:
             id_task (int): The ID of the task to retrieve.
-            db (DB, optional): The database connection. Defaults to a new instance of DB().
+            db (DB, optional): The database connection. Defaults to the shared connection from get_db().
 
         Returns:
             Task or None:
             The Task object representing the retrieved task if found, or None if not found
         """
 
-        query = db.cursor.execute(
-            '''SELECT * FROM tasks where id_task = ?''',
-            [id_task]
-        )
+        db = db or get_db()
+        query = db.cursor.execute(_SQL_TASK_GET, [id_task])
         row = query.fetchone()
         return Task._map_task(row, db=db)
 
@@ -221,17 +284,14 @@ class Task:
             'task': self.task,
             'completed': self.completed,
             'id_task': self.id_task,
-            'created_at': self.created_at.strftime(DATE_FORMAT),
-            'updated_at': self.updated_at.strftime(DATE_FORMAT),
+            'created_at': format_timestamp(self.created_at),
+            'updated_at': format_timestamp(self.updated_at),
         }
 
     def delete(self):
         if self.id_task is None:
             raise ReferenceError(
                 'This instance has not been saved yet so you cannot delete it!')
-        self.db.cursor.execute(
-            '''DELETE FROM tasks WHERE id_task = ?''',
-            [self.id_task]
-        )
-        self.db.connection.commit()
+        self.db.cursor.execute(_SQL_TASK_DELETE, [self.id_task])
+        self.db.commit()
         return self
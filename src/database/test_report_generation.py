@@ -15,10 +15,10 @@ Usage:
   test_report_generation(db_connection)
 """
 
-from database import Habit, Task, Report, Periodicity
+from database import Habit, Task, Report
 
 
-def test_report_generation(db_connection):
+def test_report_generation(db_connection, overdue_habit):
     """
     Test the report generation process for a Habit instance.
 
@@ -33,12 +33,7 @@ def test_report_generation(db_connection):
         AssertionError: Raised if any of the test assertions fail.
     """
 
-    habit = Habit(
-        'Habit 1 overdue',
-        Periodicity.DAILY,
-        ['Task 1 Overdue', 'Task 2 Overdue', 'Task 3 Overdue'],
-        db=db_connection,
-    ).save()
+    habit = overdue_habit
     Task.from_habit(habit, db=db_connection)
     db_connection.cursor.execute(
         "UPDATE tasks set completed = TRUE where id_habit = ?",
@@ -58,12 +53,14 @@ def test_report_generation(db_connection):
         [habit.id_habit]
     )
     assert len(query_rep.fetchall()) == 1
-    assert len(list(Task.objects(habit, db=db_connection))) == 0
+    # The tasks survive the report as the fresh batch for the next period,
+    # reset to uncompleted instead of being deleted and re-created.
+    task_list = list(Task.objects(habit, db=db_connection))
+    assert len(task_list) == 3
+    assert not any(task.completed for task in task_list)
     updated_habit = Habit.get(habit.id_habit, db=db_connection)
     assert updated_habit.streak == 1
 
-    Task.from_habit(habit, db=db_connection)
-
     Report(habit.id_habit, db=db_connection).generate()
     query_rep = db_connection.cursor.execute(
         "SELECT * from reports WHERE id_habit = ?",
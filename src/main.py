@@ -1,16 +1,9 @@
 """
-Here we want to register the commands for the click app, serve the basic version and help
-commands and execute the click app from the CLI arguments.
+Here we serve the basic version and help commands and execute the click app from
+the CLI arguments. The commands themselves are registered lazily by the CLI
+group, so none of the command modules is imported up front.
 """
 
-from commands import (
-    analyse_data,
-    delete_habit,
-    create_habit,
-    complete_task,
-    list_habits,
-    sync_tasks
-)
 from cli import cli
 
 if __name__ == "__main__":